@@ -5,6 +5,7 @@ Service functions for orchestrating interactions with external AI providers.
 import logging
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
@@ -15,6 +16,12 @@ from assessment.models import TestPackage as Package
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so consecutive requests to a provider reuse pooled
+# TCP/TLS connections instead of opening a new one per call.
+# Connections are opened lazily, so each forked Celery worker process gets its own.
+_http_session = requests.Session()
+_http_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 def _parse_successful_response(provider_key: str, response_data: dict) -> str:
     """
     Parses the successful JSON response from an AI provider to extract the clean,
@@ -53,7 +60,7 @@ def _execute_external_ai_request(provider_key: str, model_key: str, prompt: dict
 
     logger.info(f"Sending request to {provider_config['URL']} with model {model_key}.")
 
-    response = requests.post(
+    response = _http_session.post(
         provider_config['URL'],
         headers=headers,
         json=payload,
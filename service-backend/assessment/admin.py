@@ -2,8 +2,8 @@
 from django.contrib import admin, messages
 from django.urls import path, reverse
 from django.http import HttpResponseRedirect
+from django.utils.html import format_html_join
 from .models import TestPackage, Assessment, UserAssessmentAttempt, AssessmentTestRunner
-from .tests.test_runner import discover_tests, run_tests
 
 @admin.register(TestPackage)
 class TestPackageAdmin(admin.ModelAdmin):
@@ -20,6 +20,10 @@ class AssessmentAdmin(admin.ModelAdmin):
     search_fields = ('name', 'description', 'json_filename')
     ordering = ['name']
 
+    def get_queryset(self, request):
+        # Assessment.__str__ (used for each row's selection checkbox) lists its packages.
+        return super().get_queryset(request).prefetch_related('packages')
+
 @admin.register(UserAssessmentAttempt)
 class UserAssessmentAttemptAdmin(admin.ModelAdmin):
     list_display = ('user', 'assessment', 'is_completed', 'start_time', 'end_time')
@@ -27,6 +31,12 @@ class UserAssessmentAttemptAdmin(admin.ModelAdmin):
     search_fields = ('user__national_code', 'user__first_name', 'user__last_name', 'assessment__name')
     readonly_fields = ('start_time', 'created_at', 'updated_at')
 
+    def get_queryset(self, request):
+        # The 'user' and 'assessment' columns render __str__ of both relations, and
+        # Assessment.__str__ lists its packages; load them up-front to avoid N+1 queries.
+        queryset = super().get_queryset(request)
+        return queryset.select_related('user', 'assessment').prefetch_related('assessment__packages')
+
 @admin.register(AssessmentTestRunner)
 class AssessmentTestRunnerAdmin(admin.ModelAdmin):
 
@@ -35,6 +45,9 @@ class AssessmentTestRunnerAdmin(admin.ModelAdmin):
     def changelist_view(self, request, extra_context=None):
         extra_context = extra_context or {}
 
+        # Imported lazily so regular workers don't load the test modules at startup.
+        from .tests.test_runner import discover_tests
+
         # Discover all available tests
         available_tests = discover_tests()
 
@@ -58,14 +71,9 @@ class AssessmentTestRunnerAdmin(admin.ModelAdmin):
     # View to handle running all tests
     def run_all_tests_view(self, request):
         if request.method == 'POST':
+            from .tests.test_runner import run_tests
             results = run_tests()
-            for result in results:
-                if result['result'] == 'PASS':
-                    messages.success(request, f"PASS: {result['test']}")
-                else:
-                    # Use preformatted tag to preserve traceback formatting
-                    error_message = f"<pre>{result['error']}</pre>"
-                    messages.error(request, f"FAIL: {result['test']}", extra_tags=error_message)
+            self._add_result_messages(request, results)
 
         # Redirect back to the changelist view to display results
         return HttpResponseRedirect(reverse('admin:assessment_assessmenttestrunner_changelist'))
@@ -75,16 +83,29 @@ class AssessmentTestRunnerAdmin(admin.ModelAdmin):
         if request.method == 'POST':
             test_path = request.POST.get('test_path')
             if test_path:
+                from .tests.test_runner import run_tests
                 results = run_tests(test_path=test_path)
-                for result in results:
-                    if result['result'] == 'PASS':
-                        messages.success(request, f"PASS: {result['test']}")
-                    else:
-                        error_message = f"<pre>{result['error']}</pre>"
-                        messages.error(request, f"FAIL: {result['test']}", extra_tags=error_message)
+                self._add_result_messages(request, results)
 
         return HttpResponseRedirect(reverse('admin:assessment_assessmenttestrunner_changelist'))
 
+    # Helper to turn test results into one admin message
+    def _add_result_messages(self, request, results):
+        """
+        Adds a single summary message for the whole run: pass/fail counts in the
+        message, and each failure's name and traceback in extra_tags.
+        """
+        failures = [result for result in results if result['result'] != 'PASS']
+        summary = f"{len(results) - len(failures)} passed, {len(failures)} failed"
+        if not failures:
+            messages.success(request, f"PASS: {summary}")
+            return
+        # Use preformatted tags to preserve traceback formatting
+        details = format_html_join(
+            '', '<pre>FAIL: {}\n{}</pre>', ((result['test'], result['error']) for result in failures)
+        )
+        messages.error(request, f"FAIL: {summary}", extra_tags=details)
+
     # --- Disable standard model admin actions ---
     # We don't want to add, change, or delete these proxy objects.
 
@@ -5,6 +5,10 @@ class AssessmentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'assessment'
 
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
+
 
 
 # 7 assessments with 509 questions.   disc (24), gardner (80), holland (227), mbti (60), neo (60), pvq (40), swanson (18)
\ No newline at end of file
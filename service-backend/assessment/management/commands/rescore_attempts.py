@@ -0,0 +1,55 @@
+# service-backend/assessment/management/commands/rescore_attempts.py
+"""
+Management command to (re)calculate processed results for completed attempts.
+Used for backlog draining and re-scoring after a scorer change.
+"""
+
+from django.core.management.base import BaseCommand
+from assessment.models import UserAssessmentAttempt
+from assessment.services import BULK_SCORING_BATCH_SIZE, calculate_assessment_scores_bulk
+
+class Command(BaseCommand):
+    help = 'Re-scores completed assessment attempts in batches, one SELECT and one bulk UPDATE per batch.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'attempt_ids',
+            nargs='*',
+            type=int,
+            help='IDs of the attempts to re-score. Defaults to all completed attempts.'
+        )
+        parser.add_argument(
+            '--assessment',
+            type=str,
+            help='Only re-score attempts of the assessment with this name (case-insensitive).'
+        )
+        parser.add_argument(
+            '--missing-only',
+            action='store_true',
+            help='Only score attempts that have no processed results yet.'
+        )
+
+    def handle(self, *args, **options):
+        attempts = UserAssessmentAttempt.objects.filter(is_completed=True)
+        if options['attempt_ids']:
+            attempts = attempts.filter(id__in=options['attempt_ids'])
+        if options['assessment']:
+            attempts = attempts.filter(assessment__name__iexact=options['assessment'])
+        if options['missing_only']:
+            attempts = attempts.filter(processed_results_json__isnull=True)
+        attempt_ids = list(attempts.order_by('id').values_list('id', flat=True))
+
+        updated = 0
+        failed = []
+        for start in range(0, len(attempt_ids), BULK_SCORING_BATCH_SIZE):
+            result = calculate_assessment_scores_bulk(attempt_ids[start:start + BULK_SCORING_BATCH_SIZE])
+            updated += result['updated']
+            failed.extend(result['failed'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Re-scored {updated} of {len(attempt_ids)} attempt(s).')
+        )
+        if failed:
+            self.stdout.write(
+                self.style.ERROR(f'Scoring failed for attempt(s): {failed}')
+            )
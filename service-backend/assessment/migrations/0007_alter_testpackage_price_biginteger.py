@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0006_remove_userassessmentattempt_deepseek_input_json_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssessmentTestRunner',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Assessment Test Runner',
+                'verbose_name_plural': 'Assessment Test Runners',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('assessment.assessment',),
+        ),
+        migrations.AlterField(
+            model_name='testpackage',
+            name='price',
+            field=models.BigIntegerField(default=0, help_text='Price of the package in Iranian Rials.', verbose_name='price (Rials)'),
+        ),
+    ]
@@ -14,10 +14,10 @@ class TestPackage(models.Model):
     name = models.CharField(_("name"), max_length=255, unique=True)
     description = models.TextField(_("description"), blank=True)
     # --- Currency Change: Store price in Rials ---
-    price = models.DecimalField(
+    # Rial amounts are always whole numbers, so a 64-bit integer is used instead of
+    # a Decimal; this avoids a decimal.Decimal allocation per row in lists/responses.
+    price = models.BigIntegerField(
         _("price (Rials)"), # Clarify unit in field name/help text
-        max_digits=15, # Increased max_digits to accommodate larger Rial values
-        decimal_places=0, # Rial is typically a whole number
         default=0,
         help_text=_("Price of the package in Iranian Rials.")
     )
@@ -81,8 +81,8 @@ class SaveAssessmentResponseSerializer(serializers.Serializer):
     )
 
     def validate_response_data(self, value):
-        """Validate that response_data is a non-empty dictionary and keys are strings."""
-        if not isinstance(value, dict) or not value:
+        """Validate that response_data is non-empty (DictField already guarantees a dict)."""
+        if not value:
             raise serializers.ValidationError(
                 "response_data must be a non-empty JSON object."
             )
@@ -118,36 +118,42 @@ class UserAssessmentAttemptSubmitSerializer(serializers.ModelSerializer):
         # if request and self.instance and self.instance.user != request.user:
         #     raise serializers.ValidationError("You do not have permission to update this attempt.")
 
-        # Example: Ensure the attempt is not already completed (redundant check, view also does this)
-        if self.instance and self.instance.is_completed:
-             raise serializers.ValidationError("This assessment attempt is already completed.")
+        # The "already completed" check is not done here: update() puts it in the
+        # WHERE clause of the UPDATE so that concurrent submissions cannot both pass it.
 
         return data
 
     def update(self, instance, validated_data):
-        """Custom update logic to finalize the attempt."""
+        """
+        Finalize the attempt with a single conditional UPDATE (is_completed=False in the
+        WHERE clause), which is race-safe without a row lock. Submitting an attempt that
+        is already completed is treated as an idempotent success.
+        Sets `self.completed_now` to whether this call is the one that completed it.
+        """
         # --- Finalize the attempt ---
-        instance.is_completed = True
         # Correct way to set end_time to now
         from django.utils import timezone
-        instance.end_time = timezone.now()
+        now = timezone.now()
+        # QuerySet.update() bypasses auto_now, so updated_at is set explicitly.
+        updated = UserAssessmentAttempt.objects.filter(
+            id=instance.id, is_completed=False
+        ).update(is_completed=True, end_time=now, updated_at=now)
+        self.completed_now = bool(updated)
+
+        if updated:
+            instance.is_completed = True
+            instance.end_time = now
+            instance.updated_at = now
+        else:
+            # Another request completed it first; reflect the stored values.
+            instance.refresh_from_db(fields=['is_completed', 'end_time', 'updated_at'])
 
         # --- Important: Do NOT modify raw_results_json here ---
         # raw_results_json is already populated incrementally by the save-response endpoint.
         # This serializer/view is only responsible for marking it complete.
 
         # --- Important: Do NOT populate processed_results_json here ---
-        # processed_results_json should be populated by a background task (e.g., Celery)
-        # that reads raw_results_json, performs calculations, and saves the result.
-        # This keeps the submission endpoint fast and defers heavy processing.
-        # instance.processed_results_json = process_raw_results_to_ai_format(instance.raw_results_json)
-        # The line above is conceptual. The actual processing happens elsewhere.
-
-        instance.save()
-        # --- Trigger Celery task to process results and send to AI ---
-        # This is conceptual. The actual task definition will be in assessment/tasks.py
-        # and will be triggered here.
-        # from .tasks import process_assessment_and_send_to_ai
-        # process_assessment_and_send_to_ai.delay(instance.id)
+        # processed_results_json is populated by the assessment.tasks.score_attempt Celery task,
+        # which the view queues only when completed_now is True.
 
         return instance
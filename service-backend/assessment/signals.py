@@ -0,0 +1,35 @@
+# service-backend/assessment/signals.py
+"""
+Signal handlers for the assessment app.
+Keeps the cached package -> assessment IDs mapping in sync with the M2M table.
+"""
+from django.db.models.signals import m2m_changed, pre_delete
+from django.dispatch import receiver
+
+from .models import TestPackage, Assessment
+from .services import cache_delete_many, package_assessment_ids_cache_key
+
+
+def _invalidate_package_assessment_ids(package_ids):
+    cache_delete_many([package_assessment_ids_cache_key(package_id) for package_id in package_ids])
+
+
+@receiver(m2m_changed, sender=TestPackage.assessments.through)
+def invalidate_package_assessment_ids_on_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Drop cached assessment IDs for every package whose membership changed."""
+    if not reverse:
+        # instance is a TestPackage
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            _invalidate_package_assessment_ids([instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        # instance is an Assessment, pk_set holds the affected package IDs
+        _invalidate_package_assessment_ids(pk_set)
+    elif action == 'pre_clear':
+        # pk_set is not provided on clear, so collect the packages before they are unlinked
+        _invalidate_package_assessment_ids(instance.packages.values_list('id', flat=True))
+
+
+@receiver(pre_delete, sender=Assessment)
+def invalidate_package_assessment_ids_on_assessment_delete(sender, instance, **kwargs):
+    """Deleting an assessment removes its M2M rows without sending m2m_changed."""
+    _invalidate_package_assessment_ids(instance.packages.values_list('id', flat=True))
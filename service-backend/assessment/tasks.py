@@ -2,3 +2,25 @@
 """
 Celery tasks for the assessment app.
 """
+from celery import shared_task
+import logging
+from django.db import OperationalError
+from .services import calculate_assessment_scores
+
+logger = logging.getLogger(__name__)
+
+@shared_task(
+    bind=True,
+    acks_late=True, # Scoring is idempotent, so a task lost with its worker is safely redelivered
+    autoretry_for=(OperationalError,), # Only retry on transient database errors
+    retry_kwargs={'max_retries': 3, 'countdown': 5}
+)
+def score_attempt(self, attempt_id: int):
+    """
+    Celery task wrapper around calculate_assessment_scores, so submitting an
+    attempt does not wait for the scoring to finish.
+    """
+    result = calculate_assessment_scores(attempt_id)
+    if result['status'] == 'error':
+        logger.error(f"score_attempt task failed for Attempt {attempt_id}: {result['message']}")
+    return result
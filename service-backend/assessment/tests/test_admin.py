@@ -0,0 +1,83 @@
+# service-backend/assessment/tests/test_admin.py
+from unittest import mock
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from assessment.models import TestPackage, Assessment, UserAssessmentAttempt
+
+User = get_user_model()
+
+class AdminChangelistQueryCountTest(TestCase):
+    """
+    Guards the admin changelists against N+1 regressions: the number of queries
+    must not grow with the number of rows displayed.
+    """
+
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(
+            national_code='0000000001', phone_number='09120000001', password='adminpass123'
+        )
+        self.client.force_login(self.admin_user)
+        self.package = TestPackage.objects.create(name='Package', min_age=0, max_age=100)
+
+    def _add_rows(self, count, offset=0):
+        for i in range(offset, offset + count):
+            user = User.objects.create_user(
+                national_code=f'10000000{i:02d}', phone_number=f'091210000{i:02d}', password='pass12345'
+            )
+            assessment = Assessment.objects.create(name=f'Assessment {i}', json_filename='mbti.json')
+            self.package.assessments.add(assessment)
+            UserAssessmentAttempt.objects.create(user=user, assessment=assessment)
+
+    def _count_changelist_queries(self, url_name):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_attempt_changelist_query_count_is_constant(self):
+        url_name = 'admin:assessment_userassessmentattempt_changelist'
+        self._add_rows(1)
+        baseline = self._count_changelist_queries(url_name)
+        self._add_rows(5, offset=1)
+        self.assertEqual(self._count_changelist_queries(url_name), baseline)
+
+    def test_assessment_changelist_query_count_is_constant(self):
+        url_name = 'admin:assessment_assessment_changelist'
+        self._add_rows(1)
+        baseline = self._count_changelist_queries(url_name)
+        self._add_rows(5, offset=1)
+        self.assertEqual(self._count_changelist_queries(url_name), baseline)
+
+
+class TestRunnerMessagesTest(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser(
+            national_code='0000000002', phone_number='09120000002', password='adminpass123'
+        ))
+
+    def _run_all(self, results):
+        with mock.patch('assessment.tests.test_runner.run_tests', return_value=results):
+            response = self.client.post(reverse('admin:assessment_assessmenttestrunner_run_all'))
+        return list(get_messages(response.wsgi_request))
+
+    def test_run_adds_one_summary_message(self):
+        stored = self._run_all([
+            {'test': 'a.test_one', 'result': 'PASS', 'error': None},
+            {'test': 'a.test_two', 'result': 'FAIL', 'error': 'Traceback <module>'},
+            {'test': 'a.test_three', 'result': 'PASS', 'error': None},
+        ])
+
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(stored[0].level, messages.ERROR)
+        self.assertEqual(stored[0].message, 'FAIL: 2 passed, 1 failed')
+        self.assertEqual(stored[0].extra_tags, '<pre>FAIL: a.test_two\nTraceback &lt;module&gt;</pre>')
+
+    def test_all_passing_run_is_a_success(self):
+        stored = self._run_all([{'test': 'a.test_one', 'result': 'PASS', 'error': None}])
+
+        self.assertEqual([(m.level, m.message) for m in stored], [(messages.SUCCESS, 'PASS: 1 passed, 0 failed')])
@@ -86,3 +86,17 @@ class DISCScoreCalculatorTest(TestCase):
 
         result = _calculate_disc_scores(raw_data)
         self.assertEqual(result['stress_analysis']['level'], 'زیاد')
+
+    def test_memoized_pattern_is_not_shared_between_results(self):
+        """
+        Mutating one result's behavioral pattern must not leak into the next result
+        for the same answers, even though the pattern lookup is memoized.
+        """
+        raw_data = {str(i): {"most_like_me": "D", "least_like_me": "I"} for i in range(1, 25)}
+
+        first = _calculate_disc_scores(raw_data)
+        first['final_behavioral_pattern']['name'] = 'changed'
+        second = _calculate_disc_scores(raw_data)
+
+        self.assertIsNot(first['final_behavioral_pattern'], second['final_behavioral_pattern'])
+        self.assertNotEqual(second['final_behavioral_pattern']['name'], 'changed')
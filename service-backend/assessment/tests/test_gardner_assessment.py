@@ -46,3 +46,12 @@ class GardnerScoreCalculatorTest(TestCase):
         result = _calculate_gardner_scores(raw_data)
         self.assertEqual(result['ranked_intelligences'][0]['dimension_id'], 'naturalist')
         self.assertEqual(result['ranked_intelligences'][1]['dimension_id'], 'musical')
+
+    def test_gardner_missing_responses(self):
+        """
+        Test case where some questions are unanswered.
+        """
+        raw_data = {str(i): {"response": "3"} for i in range(1, 79)}
+        result = _calculate_gardner_scores(raw_data)
+        self.assertEqual(result['status'], 'error')
+        self.assertIn('[79, 80]', result['message'])
@@ -51,3 +51,14 @@ class HollandScoreCalculatorTest(TestCase):
 
         result = _calculate_holland_scores(raw_data)
         self.assertEqual(result['holland_code'], 'C-E-S')
+
+    def test_characteristics_are_not_shared_between_results(self):
+        """
+        Mutating one result's characteristics list must not leak into later results.
+        """
+        raw_data = {"self_assessment_1_____1": {"response": "3"}}
+        expected = _calculate_holland_scores(raw_data)['dimension_details']['realistic']['characteristics'][:]
+
+        _calculate_holland_scores(raw_data)['dimension_details']['realistic']['characteristics'].append('HACKED')
+
+        self.assertEqual(_calculate_holland_scores(raw_data)['dimension_details']['realistic']['characteristics'], expected)
@@ -1,4 +1,5 @@
 # service-backend/assessment/tests/test_mbti_assessment.py
+import json
 from django.test import TestCase
 from assessment.services import _calculate_mbti_scores
 
@@ -37,3 +38,21 @@ class MBTIScoreCalculatorTest(TestCase):
         self.assertEqual(result['scores']['I'], 7)
         self.assertEqual(result['scores']['E'], 8)
         self.assertEqual(result['preferences']['EI']['preference'], 'E')
+
+    def test_interpretations_are_not_shared_between_results(self):
+        """
+        Mutating one result's interpretation texts must not leak into later results,
+        for clear and tied preferences alike.
+        """
+        for raw_data in ({str(i): {"response": "a"} for i in range(1, 61)}, {}):
+            with self.subTest(mbti_type=_calculate_mbti_scores(raw_data)['mbti_type']):
+                expected = json.dumps(_calculate_mbti_scores(raw_data), sort_keys=True)
+
+                interpretation = _calculate_mbti_scores(raw_data)['interpretation']
+                interpretation['type_details']['name'] = 'HACKED'
+                for detail in interpretation['dimension_details'].values():
+                    detail['name'] = 'HACKED'
+                    for tied_detail in detail.get('details', {}).values():
+                        tied_detail['name'] = 'HACKED'
+
+                self.assertEqual(json.dumps(_calculate_mbti_scores(raw_data), sort_keys=True), expected)
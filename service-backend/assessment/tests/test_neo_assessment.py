@@ -122,4 +122,21 @@ class NEOScoreCalculatorTest(TestCase):
         defense_style = results["personality_styles"]["defense_style"]
         self.assertEqual(defense_style["matching_type"]["quadrant_code"], "N+O-")
         self.assertEqual(defense_style["matching_type"]["name"], "ناسازگار (Maladaptive)")
-        self.assertEqual(defense_style["matching_type"]["condition"], "روان‌رنجوری بالا و تجربه‌پذیری پایین")
\ No newline at end of file
+        self.assertEqual(defense_style["matching_type"]["condition"], "روان‌رنجوری بالا و تجربه‌پذیری پایین")
+    def test_payloads_are_not_shared_between_results(self):
+        """
+        Mutating one result's dimension texts, score ranges or style payloads must not leak into later results.
+        """
+        raw_data = {str(i): {"response": "2"} for i in range(1, 61)}
+        expected = json.dumps(_calculate_neo_scores(raw_data), sort_keys=True)
+
+        results = _calculate_neo_scores(raw_data)
+        for dimension in results["dimensions"].values():
+            dimension["name"] = "HACKED"
+            dimension["raw_score"]["range"].append(999)
+            dimension["scaled_score"]["range"].append(999)
+        for style in results["personality_styles"].values():
+            style["axes"]["vertical"] = "HACKED"
+            style["matching_type"]["name"] = "HACKED"
+
+        self.assertEqual(json.dumps(_calculate_neo_scores(raw_data), sort_keys=True), expected)
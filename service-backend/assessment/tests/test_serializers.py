@@ -0,0 +1,47 @@
+# service-backend/assessment/tests/test_serializers.py
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from assessment.models import Assessment, UserAssessmentAttempt
+from assessment.serializers import UserAssessmentAttemptSubmitSerializer
+
+class UserAssessmentAttemptSubmitSerializerTest(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(
+            national_code='5000000001', phone_number='09125000001', password='pass12345'
+        )
+        assessment = Assessment.objects.create(name='MBTI', json_filename='mbti.json')
+        self.attempt = UserAssessmentAttempt.objects.create(user=user, assessment=assessment)
+
+    def _submit(self, instance):
+        serializer = UserAssessmentAttemptSubmitSerializer(instance, data={})
+        serializer.is_valid(raise_exception=True)
+        return serializer, serializer.save()
+
+    def test_fresh_submission_completes_the_attempt(self):
+        serializer, attempt = self._submit(self.attempt)
+
+        self.assertTrue(serializer.completed_now)
+        self.assertTrue(attempt.is_completed)
+        self.assertIsNotNone(attempt.end_time)
+        stored = UserAssessmentAttempt.objects.get(id=self.attempt.id)
+        self.assertTrue(stored.is_completed)
+        self.assertEqual(stored.end_time, attempt.end_time)
+
+    def test_attempt_completed_concurrently_is_left_unchanged(self):
+        # self.attempt is now a stale instance: another request completed the row after it was loaded.
+        earlier = timezone.now() - timedelta(minutes=5)
+        UserAssessmentAttempt.objects.filter(id=self.attempt.id).update(
+            is_completed=True, end_time=earlier, updated_at=earlier
+        )
+
+        serializer, attempt = self._submit(self.attempt)
+
+        self.assertFalse(serializer.completed_now)
+        # The instance is refreshed from the stored row rather than stamped with a new end_time.
+        self.assertTrue(attempt.is_completed)
+        self.assertEqual(attempt.end_time, earlier)
+        stored = UserAssessmentAttempt.objects.get(id=self.attempt.id)
+        self.assertEqual(stored.end_time, earlier)
+        self.assertEqual(stored.updated_at, earlier)
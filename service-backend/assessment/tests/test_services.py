@@ -1,7 +1,22 @@
 # service-backend/assessment/tests/test_services.py
 
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock, skipUnless
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
-from assessment.services import _calculate_swanson_scores
+from django.utils import timezone
+from redis.exceptions import ConnectionError as RedisConnectionError
+from assessment import services
+from assessment.models import TestPackage, Assessment, UserAssessmentAttempt
+from assessment.services import (
+    _SCORERS, _calculate_swanson_scores, calculate_assessment_scores, calculate_assessment_scores_bulk,
+    get_package_assessment_ids, prepare_aggregated_package_data_for_ai
+)
 
 class SwansonAssessmentScoringTest(TestCase):
     def test_calculate_swanson_scores_predominantly_inattentive(self):
@@ -77,3 +92,246 @@ class SwansonAssessmentScoringTest(TestCase):
         self.assertEqual(result['interpretation']['category']['id'], 'No Significant ADHD')
         self.assertEqual(result['interpretation']['subscale_status']['inattention']['status'], 'Below cutoff')
         self.assertEqual(result['interpretation']['subscale_status']['hyperactivity_impulsivity']['status'], 'Below cutoff')
+
+
+class BulkScoreCalculationTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            national_code='2000000001', phone_number='09122000001', password='pass12345'
+        )
+        self.mbti = Assessment.objects.create(name='MBTI', json_filename='mbti.json')
+        self.other = Assessment.objects.create(name='Unknown', json_filename='unknown.json')
+
+    def test_bulk_scores_completed_attempts_in_constant_queries(self):
+        raw_data = {str(i): {"response": "a"} for i in range(1, 61)}
+        completed = [
+            UserAssessmentAttempt.objects.create(
+                user=self.user, assessment=assessment, is_completed=True, raw_results_json=raw_data
+            )
+            for assessment in (self.mbti, self.mbti, self.other)
+        ]
+        pending = UserAssessmentAttempt.objects.create(
+            user=self.user, assessment=self.mbti, raw_results_json=raw_data
+        )
+        ids = [attempt.id for attempt in completed] + [pending.id]
+
+        # One SELECT plus one batched UPDATE.
+        with self.assertNumQueries(2):
+            result = calculate_assessment_scores_bulk(ids)
+
+        self.assertEqual(result['updated'], 3)
+        self.assertEqual(result['failed'], [])
+        for attempt in completed[:2]:
+            attempt.refresh_from_db()
+            self.assertEqual(attempt.processed_results_json['mbti_type'], 'ISTP')
+        completed[2].refresh_from_db()
+        generic_summary = completed[2].processed_results_json['generic_summary']
+        self.assertEqual(generic_summary['total_questions_answered'], 60)
+        self.assertEqual(generic_summary['processed_at_ms'], int(completed[2].updated_at.timestamp() * 1000))
+        pending.refresh_from_db()
+        self.assertIsNone(pending.processed_results_json)
+
+    def test_rescore_attempts_command_scores_only_missing_results(self):
+        raw_data = {str(i): {"response": "a"} for i in range(1, 61)}
+        missing = UserAssessmentAttempt.objects.create(
+            user=self.user, assessment=self.mbti, is_completed=True, raw_results_json=raw_data
+        )
+        scored = UserAssessmentAttempt.objects.create(
+            user=self.user, assessment=self.mbti, is_completed=True, raw_results_json=raw_data,
+            processed_results_json={'mbti_type': 'stale'}
+        )
+
+        out = StringIO()
+        call_command('rescore_attempts', '--missing-only', '--assessment', 'mbti', stdout=out)
+
+        self.assertIn('Re-scored 1 of 1 attempt(s).', out.getvalue())
+        missing.refresh_from_db()
+        self.assertEqual(missing.processed_results_json['mbti_type'], 'ISTP')
+        scored.refresh_from_db()
+        self.assertEqual(scored.processed_results_json['mbti_type'], 'stale')
+
+
+class PackageAssessmentIdsCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.package = TestPackage.objects.create(name='Package', min_age=0, max_age=100)
+        self.first = Assessment.objects.create(name='MBTI', json_filename='mbti.json')
+        self.second = Assessment.objects.create(name='NEO', json_filename='neo.json')
+        self.package.assessments.add(self.first)
+
+    def test_ids_are_cached(self):
+        self.assertEqual(get_package_assessment_ids(self.package), [self.first.id])
+        with self.assertNumQueries(0):
+            self.assertEqual(get_package_assessment_ids(self.package), [self.first.id])
+
+    def test_membership_changes_invalidate_cache(self):
+        get_package_assessment_ids(self.package)
+        self.package.assessments.add(self.second)
+        self.assertCountEqual(get_package_assessment_ids(self.package), [self.first.id, self.second.id])
+
+        self.second.packages.clear()
+        self.assertEqual(get_package_assessment_ids(self.package), [self.first.id])
+
+        self.first.delete()
+        self.assertEqual(get_package_assessment_ids(self.package), [])
+
+
+class CacheOutageTest(TestCase):
+    """With Redis unreachable, caching is skipped and the database/scorer is used instead."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            national_code='3000000003', phone_number='09123000003', password='pass12345'
+        )
+        self.package = TestPackage.objects.create(name='Package', min_age=0, max_age=100)
+        self.assessment = Assessment.objects.create(name='MBTI', json_filename='mbti.json')
+        outage = RedisConnectionError('Connection refused')
+        patchers = [
+            mock.patch.object(cache, name, side_effect=outage) for name in ('get', 'set', 'delete_many')
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_scoring_succeeds(self):
+        attempt = UserAssessmentAttempt.objects.create(
+            user=self.user, assessment=self.assessment, is_completed=True,
+            raw_results_json={str(i): {"response": "a"} for i in range(1, 61)}
+        )
+        with self.assertLogs('assessment.services', level='WARNING'):
+            self.assertEqual(calculate_assessment_scores(attempt.id)['status'], 'success')
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.processed_results_json['mbti_type'], 'ISTP')
+
+    def test_package_ids_and_membership_changes_fall_through_to_database(self):
+        with self.assertLogs('assessment.services', level='WARNING'):
+            self.package.assessments.add(self.assessment)
+            self.assertEqual(get_package_assessment_ids(self.package), [self.assessment.id])
+            self.assessment.delete()
+            self.assertEqual(get_package_assessment_ids(self.package), [])
+
+
+class ScoreCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            national_code='3000000001', phone_number='09123000001', password='pass12345'
+        )
+        self.assessment = Assessment.objects.create(name='MBTI', json_filename='mbti.json')
+
+    def test_identical_raw_results_are_scored_once(self):
+        raw_data = {str(i): {"response": "a"} for i in range(1, 61)}
+        attempts = [
+            UserAssessmentAttempt.objects.create(
+                user=self.user, assessment=self.assessment, is_completed=True, raw_results_json=raw_data
+            )
+            for _ in range(2)
+        ]
+        scorer = mock.Mock(wraps=_SCORERS['mbti'])
+        with mock.patch.dict(_SCORERS, {'mbti': scorer}):
+            for attempt in attempts:
+                self.assertEqual(calculate_assessment_scores(attempt.id)['status'], 'success')
+
+        self.assertEqual(scorer.call_count, 1)
+        for attempt in attempts:
+            attempt.refresh_from_db()
+            self.assertEqual(attempt.processed_results_json['mbti_type'], 'ISTP')
+
+    def test_bumping_scorer_version_bypasses_old_entries(self):
+        raw_data = {str(i): {"response": "a"} for i in range(1, 61)}
+        scorer = mock.Mock(wraps=_SCORERS['mbti'])
+        with mock.patch.dict(_SCORERS, {'mbti': scorer}):
+            services._score_raw_results_cached('MBTI', raw_data)
+            with mock.patch.object(services, 'SCORER_VERSION', services.SCORER_VERSION + 1):
+                services._score_raw_results_cached('MBTI', raw_data)
+
+        self.assertEqual(scorer.call_count, 2)
+
+
+class UnchangedResultsWriteTest(TestCase):
+    def test_rescoring_to_identical_results_does_not_touch_updated_at(self):
+        cache.clear()
+        user = get_user_model().objects.create_user(
+            national_code='3000000002', phone_number='09123000002', password='pass12345'
+        )
+        assessment = Assessment.objects.create(name='MBTI', json_filename='mbti.json')
+        attempt = UserAssessmentAttempt.objects.create(
+            user=user, assessment=assessment, is_completed=True,
+            raw_results_json={str(i): {"response": "a"} for i in range(1, 61)}
+        )
+
+        self.assertEqual(calculate_assessment_scores(attempt.id)['status'], 'success')
+        attempt.refresh_from_db()
+        first_updated_at = attempt.updated_at
+        self.assertEqual(attempt.processed_results_json['mbti_type'], 'ISTP')
+
+        result = calculate_assessment_scores(attempt.id)
+        self.assertEqual(result['status'], 'success')
+        self.assertIn('unchanged', result['message'])
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.updated_at, first_updated_at)
+
+
+class StringEncodedRawResultsTest(TestCase):
+    def test_json_string_raw_results_are_decoded_before_scoring(self):
+        cache.clear()
+        user = get_user_model().objects.create_user(
+            national_code='5000000001', phone_number='09125000001', password='pass12345'
+        )
+        assessment = Assessment.objects.create(name='MBTI', json_filename='mbti.json')
+        raw_data = {str(i): {"response": "a"} for i in range(1, 61)}
+        attempt = UserAssessmentAttempt.objects.create(
+            user=user, assessment=assessment, is_completed=True, raw_results_json=json.dumps(raw_data)
+        )
+
+        self.assertEqual(calculate_assessment_scores(attempt.id)['status'], 'success')
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.processed_results_json['mbti_type'], 'ISTP')
+
+
+class AggregatedPackageDataTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            national_code='4000000001', phone_number='09124000001', password='pass12345', gender='M'
+        )
+        self.package = TestPackage.objects.create(name='Package', min_age=0, max_age=100)
+
+    def test_collects_completed_attempts_of_package_assessments(self):
+        for index in range(3):
+            assessment = Assessment.objects.create(name=f'Assessment {index}', json_filename='x.json')
+            self.package.assessments.add(assessment)
+            UserAssessmentAttempt.objects.create(
+                user=self.user, assessment=assessment, is_completed=index > 0,
+                processed_results_json={'index': index} if index < 2 else None
+            )
+        outside = Assessment.objects.create(name='Outside', json_filename='x.json')
+        UserAssessmentAttempt.objects.create(user=self.user, assessment=outside, is_completed=True)
+
+        data = prepare_aggregated_package_data_for_ai(self.user, self.package)
+
+        self.assertEqual(data['package_id'], self.package.id)
+        self.assertEqual(data['user_data']['gender'], 'M')
+        self.assertCountEqual(
+            [(item['assessment_name'], item['results']) for item in data['assessments_data']],
+            [('Assessment 1', {'index': 1}), ('Assessment 2', {})]
+        )
+
+    @skipUnless(connection.vendor == 'postgresql', "json_agg branch is PostgreSQL-only")
+    def test_postgresql_aggregate_matches_orm_path(self):
+        now = timezone.now()
+        assessment_ids = []
+        for index in range(4):
+            assessment = Assessment.objects.create(name=f'Assessment {index}', json_filename='x.json')
+            assessment_ids.append(assessment.id)
+            attempt = UserAssessmentAttempt.objects.create(
+                user=self.user, assessment=assessment, is_completed=index > 0,
+                processed_results_json={'index': index, 'nested': [index]} if index % 2 else None
+            )
+            # Distinct start times, so both paths have a well-defined newest-first order.
+            UserAssessmentAttempt.objects.filter(id=attempt.id).update(start_time=now - timedelta(minutes=index))
+
+        self.assertEqual(
+            services._collect_completed_assessments_data(self.user, assessment_ids),
+            services._collect_completed_assessments_data_orm(self.user, assessment_ids)
+        )
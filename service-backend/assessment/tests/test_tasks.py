@@ -0,0 +1,55 @@
+# service-backend/assessment/tests/test_tasks.py
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import OperationalError
+from django.test import TestCase
+from assessment import services
+from assessment.models import Assessment, UserAssessmentAttempt
+from assessment.services import calculate_assessment_scores
+from assessment.tasks import score_attempt
+
+class ScoreAttemptRetryTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        user = get_user_model().objects.create_user(
+            national_code='6000000001', phone_number='09126000001', password='pass12345'
+        )
+        assessment = Assessment.objects.create(name='MBTI', json_filename='mbti.json')
+        self.attempt = UserAssessmentAttempt.objects.create(
+            user=user, assessment=assessment, is_completed=True,
+            raw_results_json={str(i): {"response": "a"} for i in range(1, 61)}
+        )
+
+    def test_task_retries_only_transient_database_errors(self):
+        self.assertEqual(score_attempt.autoretry_for, (OperationalError,))
+        self.assertIs(score_attempt.acks_late, True)
+
+    def test_operational_error_propagates_for_retry(self):
+        with mock.patch.object(services, '_score_raw_results_cached', side_effect=OperationalError('connection lost')):
+            with self.assertRaises(OperationalError):
+                calculate_assessment_scores(self.attempt.id)
+
+        # Nothing is stored, so the attempt stays pending for the retry.
+        self.attempt.refresh_from_db()
+        self.assertIsNone(self.attempt.processed_results_json)
+
+    def test_other_errors_are_reported_without_raising(self):
+        with mock.patch.object(services, '_score_raw_results_cached', side_effect=ValueError('bad data')):
+            with self.assertLogs('assessment.services', level='ERROR'):
+                result = calculate_assessment_scores(self.attempt.id)
+
+        self.assertEqual(result['status'], 'error')
+        # Stored as a terminal marker, so the attempt no longer looks like it is still being scored.
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.processed_results_json, {'status': 'error', 'message': 'bad data'})
+
+    def test_attempt_without_responses_is_marked_skipped(self):
+        UserAssessmentAttempt.objects.filter(id=self.attempt.id).update(raw_results_json=None)
+
+        with self.assertLogs('assessment.services', level='WARNING'):
+            result = calculate_assessment_scores(self.attempt.id)
+
+        self.assertEqual(result['status'], 'skipped')
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.processed_results_json['status'], 'skipped')
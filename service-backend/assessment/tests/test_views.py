@@ -0,0 +1,155 @@
+# service-backend/assessment/tests/test_views.py
+from datetime import date, timedelta
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from ai_integration.models import AIProvider
+from assessment.models import TestPackage, Assessment, UserAssessmentAttempt
+from assessment.serializers import UserAssessmentAttemptSubmitSerializer
+
+User = get_user_model()
+
+class SubmitAssessmentAttemptViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            national_code='4000000001', phone_number='09124000001', password='pass12345'
+        )
+        self.client.force_authenticate(self.user)
+        self.assessment = Assessment.objects.create(name='MBTI', json_filename='mbti.json')
+        self.attempt = UserAssessmentAttempt.objects.create(user=self.user, assessment=self.assessment)
+        self.url = reverse('assessment:attempt_submit', args=[self.assessment.id])
+
+    @mock.patch('assessment.views.score_attempt')
+    def test_completing_submission_queues_scoring_on_commit(self, score_attempt):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(callbacks), 1)
+        score_attempt.delay.assert_called_once_with(self.attempt.id)
+
+    @mock.patch('assessment.views.score_attempt')
+    def test_submission_completed_concurrently_does_not_queue_scoring(self, score_attempt):
+        def complete_concurrently(data):
+            # Another request completes the attempt between the view's lookup and its UPDATE.
+            UserAssessmentAttempt.objects.filter(id=self.attempt.id).update(is_completed=True, end_time=timezone.now())
+            return data
+
+        with mock.patch.object(UserAssessmentAttemptSubmitSerializer, 'validate', side_effect=complete_concurrently):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(callbacks, [])
+        score_attempt.delay.assert_not_called()
+
+
+@override_settings(AI_PROVIDERS={'test_provider': {'MODELS': {'test_model': {}}}})
+class SendPackageResultsToAiViewTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            national_code='4000000002', phone_number='09124000002', password='pass12345',
+            birth_date=date(2000, 1, 1)
+        )
+        self.client.force_authenticate(self.user)
+        AIProvider.objects.create(name='Test', settings_config_key='test_provider', is_active_for_users=True)
+        self.package = TestPackage.objects.create(name='Package', min_age=0, max_age=150)
+        self.assessment = Assessment.objects.create(name='MBTI', json_filename='mbti.json')
+        self.package.assessments.add(self.assessment)
+        self.url = reverse('assessment:send_package_to_ai', args=[self.package.id])
+        patcher = mock.patch('assessment.views.send_to_ai')
+        self.send_to_ai = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.send_to_ai.delay.return_value.id = 'task-id'
+
+    def _complete_attempt(self, end_time, raw_results_json=None, processed_results_json=None):
+        return UserAssessmentAttempt.objects.create(
+            user=self.user, assessment=self.assessment, is_completed=True, end_time=end_time,
+            raw_results_json=raw_results_json, processed_results_json=processed_results_json
+        )
+
+    def _post(self):
+        return self.client.post(self.url, {'provider_model_key': 'test_provider.test_model'})
+
+    def test_recently_submitted_unscored_attempt_returns_conflict(self):
+        self._complete_attempt(end_time=timezone.now())
+
+        self.assertEqual(self._post().status_code, 409)
+        self.send_to_ai.delay.assert_not_called()
+
+    def test_scored_attempts_are_sent(self):
+        self._complete_attempt(end_time=timezone.now(), processed_results_json={'mbti_type': 'ISTP'})
+
+        self.assertEqual(self._post().status_code, 202)
+        self.send_to_ai.delay.assert_called_once_with(self.user.id, self.package.id, 'test_provider', 'test_model')
+
+    def test_skipped_or_failed_attempts_do_not_block_sending(self):
+        for marker in ({'status': 'skipped', 'message': 'No responses were recorded.'},
+                       {'status': 'error', 'message': 'bad data'}):
+            with self.subTest(marker=marker):
+                UserAssessmentAttempt.objects.all().delete()
+                self._complete_attempt(end_time=timezone.now(), processed_results_json=marker)
+
+                self.assertEqual(self._post().status_code, 202)
+
+    def test_stale_unscored_attempts_are_scored_inline(self):
+        # Lost or exhausted score_attempt tasks, and legacy attempts with no end_time at all.
+        stale = self._complete_attempt(
+            end_time=timezone.now() - timedelta(hours=1),
+            raw_results_json={str(i): {"response": "a"} for i in range(1, 61)}
+        )
+        legacy_without_responses = self._complete_attempt(end_time=None)
+
+        with self.assertLogs('assessment.services', level='WARNING'):
+            response = self._post()
+
+        self.assertEqual(response.status_code, 202)
+        stale.refresh_from_db()
+        legacy_without_responses.refresh_from_db()
+        self.assertEqual(stale.processed_results_json['mbti_type'], 'ISTP')
+        self.assertEqual(legacy_without_responses.processed_results_json['status'], 'skipped')
+
+
+class ListViewQueryCountTest(APITestCase):
+    """
+    Guards the list endpoints against N+1 regressions: the number of queries
+    must not grow with the number of rows returned.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            national_code='4000000003', phone_number='09124000003', password='pass12345',
+            birth_date=date(2000, 1, 1)
+        )
+        self.client.force_authenticate(self.user)
+
+    def _add_rows(self, count, offset=0):
+        for i in range(offset, offset + count):
+            package = TestPackage.objects.create(name=f'Package {i}', min_age=0, max_age=150)
+            for j in range(2):
+                assessment = Assessment.objects.create(name=f'Assessment {i}-{j}', json_filename='mbti.json')
+                package.assessments.add(assessment)
+                UserAssessmentAttempt.objects.create(user=self.user, assessment=assessment)
+
+    def _count_list_queries(self, url_name):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_list_query_counts_are_constant(self):
+        url_names = ('assessment:package_list', 'assessment:assessment_list', 'assessment:user_attempt_list')
+        self._add_rows(1)
+        baselines = {url_name: self._count_list_queries(url_name) for url_name in url_names}
+        self._add_rows(5, offset=1)
+        for url_name in url_names:
+            with self.subTest(url_name=url_name), self.assertNumQueries(baselines[url_name]):
+                response = self.client.get(reverse(url_name))
+            self.assertEqual(len(response.data), 6 if url_name == 'assessment:package_list' else 12)
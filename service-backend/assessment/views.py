@@ -4,7 +4,9 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.db.models import Q
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import Q, Prefetch
 from django.conf import settings
 from rest_framework.exceptions import ValidationError
 
@@ -17,7 +19,8 @@ from .serializers import (
 )
 # Import the new service function
 from .services import calculate_assessment_scores, prepare_aggregated_package_data_for_ai
-# Import the Celery task
+# Import the Celery tasks
+from .tasks import score_attempt
 from ai_integration.tasks import send_to_ai
 # Import AI models for validation
 from ai_integration.models import AIProvider, AIInteraction
@@ -25,6 +28,17 @@ from ai_integration.models import AIProvider, AIInteraction
 # Import user model
 User = settings.AUTH_USER_MODEL
 
+# How long after submission an unscored attempt is treated as still queued for score_attempt
+# (which retries 3 times, 5 seconds apart) before SendPackageResultsToAiView scores it itself.
+SCORING_GRACE_PERIOD = timedelta(minutes=2)
+
+# --- Shared prefetches for the serializers' related-name fields ---
+# AssessmentSerializer.package_names only needs each package's name (its __str__).
+PACKAGE_NAMES_PREFETCH = Prefetch('packages', queryset=TestPackage.objects.only('id', 'name'))
+# UserAssessmentAttemptSerializer reads user.national_code, assessment.name and assessment.packages.
+ATTEMPT_RELATED_FIELDS = ('user', 'assessment')
+ATTEMPT_PREFETCH = Prefetch('assessment__packages', queryset=TestPackage.objects.only('id', 'name'))
+
 # --- Views for Test Packages ---
 
 class TestPackageListView(generics.ListAPIView):
@@ -44,7 +58,9 @@ class TestPackageListView(generics.ListAPIView):
 
         if user_age is not None:
             # Filter packages based on user's age
-            queryset = TestPackage.objects.filter(is_active=True, min_age__lte=user_age, max_age__gte=user_age)
+            queryset = TestPackage.objects.filter(
+                is_active=True, min_age__lte=user_age, max_age__gte=user_age
+            ).prefetch_related('assessments__packages') # str(assessment) lists its packages
         else:
             # If age is not available, maybe show all or none? Let's show none for security/safety.
             # Or, you could show packages with min_age=0 or a default range.
@@ -67,7 +83,9 @@ class TestPackageDetailView(generics.RetrieveAPIView):
 
         if user_age is not None:
             # Allow access only if package is active and age-appropriate
-            return TestPackage.objects.filter(is_active=True, min_age__lte=user_age, max_age__gte=user_age)
+            return TestPackage.objects.filter(
+                is_active=True, min_age__lte=user_age, max_age__gte=user_age
+            ).prefetch_related('assessments__packages') # str(assessment) lists its packages
         else:
             return TestPackage.objects.none()
 
@@ -99,7 +117,7 @@ class AssessmentListView(generics.ListAPIView):
              # Use distinct() to avoid duplicates if an assessment is in multiple accessible packages
              return Assessment.objects.filter(
                  is_active=True, packages__in=accessible_package_ids # Updated filter using M2M
-             ).distinct()
+             ).distinct().prefetch_related(PACKAGE_NAMES_PREFETCH)
         else:
             return Assessment.objects.none()
 
@@ -124,7 +142,7 @@ class AssessmentDetailView(generics.RetrieveAPIView):
             # Get assessments that belong to any of these accessible packages
             return Assessment.objects.filter(
                 is_active=True, packages__in=accessible_package_ids # Updated filter using M2M
-            ).distinct() # Use distinct to prevent duplicates
+            ).distinct().prefetch_related(PACKAGE_NAMES_PREFETCH) # Use distinct to prevent duplicates
         else:
             return Assessment.objects.none()
 
@@ -151,7 +169,7 @@ class UserAssessmentAttemptDetailView(generics.RetrieveAPIView):
         # Find the attempt for this user and assessment
         # get_object_or_404 handles the case where the attempt doesn't exist
         attempt = get_object_or_404(
-            UserAssessmentAttempt,
+            UserAssessmentAttempt.objects.select_related(*ATTEMPT_RELATED_FIELDS).prefetch_related(ATTEMPT_PREFETCH),
             user=user,
             assessment_id=assessment_id
             # No need for is_completed=False filter here, user can view any attempt
@@ -241,24 +259,19 @@ class SubmitAssessmentAttemptView(views.APIView):
         )
 
         # 2. Validate using the serializer (basic validation)
-        serializer = UserAssessmentAttemptSubmitSerializer(data=request.data)
+        serializer = UserAssessmentAttemptSubmitSerializer(attempt, data=request.data)
         serializer.is_valid(raise_exception=True) # Raises 400 if invalid
 
         # 3. --- Finalize the attempt ---
-        attempt.is_completed = True
-        attempt.end_time = timezone.now()
-        attempt.save(update_fields=['is_completed', 'end_time', 'updated_at'])
-
-        # 4. --- NEW: Trigger immediate score calculation service ---
-        # After the attempt is marked as completed, calculate the scores.
-        calculation_result = calculate_assessment_scores(attempt.id)
-        # Optionally, log the result or handle errors from the service
-        # For example, if calculation failed, you might want to return a different status
-        # or trigger a retry mechanism. For now, we assume success or internal handling.
-        if calculation_result['status'] == 'error':
-             # Log the error, perhaps return a warning in the response
-             # logger.error(calculation_result['message']) # Assuming logger is imported
-             pass # Or handle as needed
+        # A single conditional UPDATE; a concurrent duplicate submission is a no-op.
+        attempt = serializer.save()
+
+        # 4. --- Queue score calculation ---
+        # Scoring runs in a Celery worker once the completed state is committed,
+        # so the response does not wait for it; processed_results_json is filled in shortly after.
+        if serializer.completed_now:
+            attempt_id = attempt.id
+            transaction.on_commit(lambda: score_attempt.delay(attempt_id))
 
         # 5. Prepare and return the updated attempt data
         response_serializer = UserAssessmentAttemptSerializer(attempt)
@@ -363,7 +376,9 @@ class UserAssessmentAttemptListView(generics.ListAPIView):
     filterset_fields = ['assessment__packages', 'assessment', 'is_completed'] # Filter by package, assessment, status
 
     def get_queryset(self):
-        return UserAssessmentAttempt.objects.filter(user=self.request.user)
+        return UserAssessmentAttempt.objects.filter(
+            user=self.request.user
+        ).select_related(*ATTEMPT_RELATED_FIELDS).prefetch_related(ATTEMPT_PREFETCH)
 
 
 # --- NEW VIEW: Manually Trigger Sending Package Results to AI ---
@@ -448,6 +463,23 @@ class SendPackageResultsToAiView(views.APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Scoring runs asynchronously after submission and always stores scores or an error marker,
+        # so a completed attempt with NULL processed results has not been scored yet and would
+        # reach the AI prompt as empty results.
+        unscored_attempts = UserAssessmentAttempt.objects.filter(
+            user=user, assessment_id__in=package_assessment_ids, is_completed=True,
+            processed_results_json__isnull=True
+        )
+        if unscored_attempts.filter(end_time__gte=timezone.now() - SCORING_GRACE_PERIOD).exists():
+            return Response(
+                {"status": "error", "message": "Your results are still being scored. Please try again shortly."},
+                status=status.HTTP_409_CONFLICT
+            )
+        # Older ones will not be scored by a task any more (task lost, retries exhausted, or completed
+        # before scoring moved to Celery), so they are scored here rather than blocking the user.
+        for attempt_id in unscored_attempts.values_list('id', flat=True):
+            calculate_assessment_scores(attempt_id)
+
         # 5. --- Trigger the Celery Task with new parameters ---
         task_result = send_to_ai.delay(user.id, package.id, provider_key, model_key)
 
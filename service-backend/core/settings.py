@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/4.x/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from decouple import config # For environment variables
 
@@ -245,6 +246,20 @@ CAPTCHA_FONT_SIZE = 30
 CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = config('CELERY_RESULT_BACKEND', default='redis://localhost:6379/0')
 
+# --- Cache Configuration ---
+# A shared Redis cache, so every gunicorn worker and the Celery worker see the same entries
+# (and the same invalidations); a per-process LocMemCache would serve stale data across workers.
+# Uses its own Redis database, separate from the Celery broker's.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.redis.RedisCache'),
+        'LOCATION': config('CACHE_LOCATION', default='redis://localhost:6379/1'),
+    }
+}
+# The test suite must not need a live Redis; each test process gets its own in-memory cache.
+if sys.argv[1:2] == ['test']:
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
 # Optional Celery settings for task serialization, acceptance, etc.
 # CELERY_ACCEPT_CONTENT = ['json']
 # CELERY_TASK_SERIALIZER = 'json'